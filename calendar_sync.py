@@ -6,20 +6,28 @@ This script retrieves upcoming events from Google Calendar for specified users
 and creates corresponding tasks in ClickUp for capacity planning.
 """
 
-import calendar
+import atexit
 import datetime
+import functools
+import json
 import logging
+import logging.handlers
+import queue
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from html.parser import HTMLParser
+from typing import NamedTuple
 
+import ciso8601
 import requests
 from config import (
     CALENDAR_SYNC_DAYS,
     CLICKUP_API_KEY,
     CLICKUP_LIST_ID,
     CLICKUP_TEAM_ID,
-    DATE_FORMAT,
     DATE_FORMAT_NO_TIME,
     DEBUG,
     GOOGLE_CALENDAR_SCOPES,
@@ -31,9 +39,33 @@ from config import (
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from requests.adapters import HTTPAdapter
 
 __version__ = "0.1.0"
 
+# Maximum number of users whose calendars are fetched concurrently
+GOOGLE_MAX_WORKERS = 8
+
+# Partial response mask for Calendar event listings; only fields used by EventProcessor are requested
+GOOGLE_EVENT_FIELDS = (
+    "nextPageToken,"
+    "items(summary,attendees/email,start,end,iCalUID,description,location,status,recurrence,"
+    "recurringEventId,organizer/email,conferenceData/entryPoints(entryPointType,uri))"
+)
+
+# Maximum number of ClickUp tasks created concurrently
+CLICKUP_MAX_WORKERS = 20
+
+# Number of times a rate-limited (HTTP 429) ClickUp request is retried, and the longest wait between attempts
+CLICKUP_MAX_RETRIES = 5
+CLICKUP_MAX_RETRY_DELAY = 60
+
+# Runs of three or more newlines, collapsed to a blank line in cleaned descriptions
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+
+# Internal domains, normalised for exact lookups against an attendee's email domain
+_HOST_DOMAIN_SET = frozenset(domain.lower() for domain in HOST_DOMAINS)
+
 
 # Set up logging
 def setup_logging():
@@ -41,13 +73,24 @@ def setup_logging():
     log_format = "%(asctime)s - %(levelname)-7s - %(filename)s:%(funcName)s:%(lineno)d - %(message)s"
     log_level = logging.DEBUG if DEBUG else logging.INFO
 
-    logging.basicConfig(filename=LOG_FILE, format=log_format, level=log_level)
+    formatter = logging.Formatter(log_format)
+
+    file_handler = logging.FileHandler(LOG_FILE)
+    file_handler.setFormatter(formatter)
 
     # Add console handler for visibility
     console = logging.StreamHandler()
-    console.setLevel(log_level)
-    console.setFormatter(logging.Formatter(log_format))
-    logging.getLogger("").addHandler(console)
+    console.setFormatter(formatter)
+
+    # Callers only enqueue records; a background listener thread writes them to the file and console
+    log_queue = queue.Queue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root_logger = logging.getLogger("")
+    root_logger.setLevel(log_level)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     # Handle uncaught exceptions
     def handle_exception(exc_type, exc_value, exc_traceback):
@@ -104,13 +147,13 @@ class HTMLtoTextConverter(HTMLParser):
             for attr in attrs:
                 if attr[0] == "href":
                     self.link_href = attr[1]
-        elif tag in ["script", "style"]:
+        elif tag in ("script", "style"):
             self.skip_data = True
 
     def handle_endtag(self, tag):
         if tag == "p":
             self.result.append("\n")
-        elif tag in ["ul", "ol"]:
+        elif tag in ("ul", "ol"):
             self.in_list = False
             self.result.append("\n")
         elif tag == "a":
@@ -118,7 +161,7 @@ class HTMLtoTextConverter(HTMLParser):
                 self.result.append(f" ({self.link_href})")
             self.in_link = False
             self.link_href = ""
-        elif tag in ["script", "style"]:
+        elif tag in ("script", "style"):
             self.skip_data = False
 
     def handle_data(self, data):
@@ -129,8 +172,13 @@ class HTMLtoTextConverter(HTMLParser):
         return "".join(self.result)
 
 
+@functools.lru_cache(maxsize=1024)
 def clean_html(html_text):
-    """Convert HTML to plain text, preserving structure."""
+    """
+    Convert HTML to plain text, preserving structure.
+
+    Results are cached, since instances of a recurring meeting share the same description.
+    """
     if not html_text:
         return ""
 
@@ -138,7 +186,7 @@ def clean_html(html_text):
     html_text = html_text.replace("&nbsp;", " ")
 
     # Remove excessive whitespace
-    html_text = re.sub(r"\s+", " ", html_text)
+    html_text = " ".join(html_text.split())
 
     # Parse HTML
     converter = HTMLtoTextConverter()
@@ -146,11 +194,16 @@ def clean_html(html_text):
     text = converter.get_text()
 
     # Clean up extra newlines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _EXCESS_NEWLINES_RE.sub("\n\n", text)
 
     return text.strip()
 
 
+def is_internal_email(email):
+    """Return True if the email address belongs to one of the HOST_DOMAINS."""
+    return email.rpartition("@")[2].lower() in _HOST_DOMAIN_SET
+
+
 class GoogleCalendarService:
     """Service for fetching Google Calendar events."""
 
@@ -164,6 +217,8 @@ class GoogleCalendarService:
         """
         self.service_account_file = service_account_file
         self.scopes = scopes
+        self._credentials = service_account.Credentials.from_service_account_file(service_account_file, scopes=scopes)
+        self._services = {}
 
     def get_credentials(self, user_email):
         """
@@ -175,22 +230,26 @@ class GoogleCalendarService:
         Returns:
             Credentials: Google service account credentials
         """
-        return service_account.Credentials.from_service_account_file(
-            self.service_account_file, scopes=self.scopes, subject=user_email
-        )
+        return self._credentials.with_subject(user_email)
 
     def get_calendar_service(self, user_email):
         """
         Build a Google Calendar service for the specified user.
 
+        Services are cached per user, so repeated calls reuse the same client.
+
         Args:
             user_email (str): Email of the user
 
         Returns:
             Service: Google Calendar service
         """
-        credentials = self.get_credentials(user_email)
-        return build("calendar", "v3", credentials=credentials)
+        service = self._services.get(user_email)
+        if service is None:
+            credentials = self.get_credentials(user_email)
+            service = build("calendar", "v3", credentials=credentials, cache_discovery=False)
+            self._services[user_email] = service
+        return service
 
     def get_calendar_events(self, user_email, days_ahead=14):
         """
@@ -203,7 +262,7 @@ class GoogleCalendarService:
         Returns:
             list: List of calendar events
         """
-        logger.debug(f"Getting events for {user_email}...")
+        logger.debug("Getting events for %s...", user_email)
 
         try:
             service = self.get_calendar_service(user_email)
@@ -212,29 +271,36 @@ class GoogleCalendarService:
             now = datetime.datetime.utcnow().isoformat() + "Z"  # 'Z' indicates UTC time
             later = (datetime.datetime.utcnow() + datetime.timedelta(days=days_ahead)).isoformat() + "Z"
 
-            events_result = (
-                service.events()
-                .list(
-                    calendarId="primary",
-                    timeMin=now,
-                    timeMax=later,
-                    maxResults=100,
-                    singleEvents=True,
-                    orderBy="startTime",
-                )
-                .execute()
+            events = []
+            request = service.events().list(
+                calendarId="primary",
+                timeMin=now,
+                timeMax=later,
+                maxResults=2500,
+                singleEvents=True,
+                orderBy="startTime",
+                fields=GOOGLE_EVENT_FIELDS,
             )
 
-            return events_result.get("items", [])
+            # Follow nextPageToken until all events in the range have been retrieved
+            while request is not None:
+                events_result = request.execute()
+                events.extend(events_result.get("items", []))
+                request = service.events().list_next(request, events_result)
+
+            return events
 
         except HttpError as error:
-            logger.exception(f"Error retrieving calendar for {user_email}: {error}")
+            logger.exception("Error retrieving calendar for %s: %s", user_email, error)
             return []
 
     def get_all_calendar_events(self, user_emails, days_ahead=14):
         """
         Fetch calendar events for multiple users.
 
+        Requests for each user are issued concurrently since they are I/O bound.
+        Results are combined in the same order as ``user_emails``.
+
         Args:
             user_emails (list): List of user emails
             days_ahead (int): Number of days to look ahead for events
@@ -244,14 +310,38 @@ class GoogleCalendarService:
         """
         all_events = []
 
-        for email in user_emails:
-            events = self.get_calendar_events(email, days_ahead)
-            all_events.extend(events)
+        if not user_emails:
+            return all_events
 
-        logger.debug(f"Total events retrieved: {len(all_events)}")
+        max_workers = min(GOOGLE_MAX_WORKERS, len(user_emails))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for events in executor.map(lambda email: self.get_calendar_events(email, days_ahead), user_emails):
+                all_events.extend(events)
+
+        logger.debug("Total events retrieved: %d", len(all_events))
         return all_events
 
 
+class ProcessedEvent(NamedTuple):
+    """A calendar event reduced to the fields needed to create a ClickUp task."""
+
+    summary: str
+    attendees: list
+    start: datetime.datetime
+    end: datetime.datetime
+    duration: datetime.timedelta
+    ical_uid: str
+    description: str
+    location: str
+    meeting_link: str
+    status: str
+    is_recurring: bool
+    mentions_recurring_series: bool
+    organizer: str
+    recurrence: list
+    recurring_event_id: str
+
+
 class EventProcessor:
     """Process and filter calendar events."""
 
@@ -263,11 +353,11 @@ class EventProcessor:
             events (list): Raw calendar events
 
         Returns:
-            dict: Deduplicated and processed events
+            dict: Deduplicated ProcessedEvent records keyed by iCalUID
         """
         processed_events = {}
 
-        logger.debug(f"Processing {len(events)} events...")
+        logger.debug("Processing %d events...", len(events))
 
         for event in events:
             # Skip events without summary
@@ -277,59 +367,59 @@ class EventProcessor:
 
             # Skip events without attendees
             if "attendees" not in event:
-                logger.debug(f"No attendees. Skipping event: '{event['summary']}'...")
+                logger.debug("No attendees. Skipping event: '%s'...", event["summary"])
                 continue
 
             # Extract start and end times
             start = event["start"].get("dateTime", event["start"].get("date"))
             end = event["end"].get("dateTime", event["end"].get("date"))
 
-            # Calculate duration
-            duration = None
+            # Parse start and end times
             try:
-                duration = datetime.datetime.strptime(end, DATE_FORMAT) - datetime.datetime.strptime(start, DATE_FORMAT)
+                start_dt = ciso8601.parse_rfc3339(start)
+                end_dt = ciso8601.parse_rfc3339(end)
             except ValueError:
-                logger.debug(f"Failed date format: {event['summary']} (start={start}, end={end})")
+                logger.debug("Failed date format: %s (start=%s, end=%s)", event["summary"], start, end)
 
                 # Try all-day event format
                 try:
                     duration = datetime.datetime.strptime(end, DATE_FORMAT_NO_TIME) - datetime.datetime.strptime(
                         start, DATE_FORMAT_NO_TIME
                     )
-                    logger.debug(f"No time on event. Skipping event: '{event['summary']}'...")
+                    logger.debug("No time on event. Skipping event: '%s'...", event["summary"])
                     continue
                 except ValueError:
                     logger.error(
-                        f"Failed date format for all day: {event['summary']} (start={start}, end={end}). Skipping..."
+                        "Failed date format for all day: %s (start=%s, end=%s). Skipping...",
+                        event["summary"],
+                        start,
+                        end,
                     )
                     continue
 
-            if duration is None:
-                logger.error(f"Failed date format import: {event['summary']} (start={start}, end={end}). Skipping...")
-                continue
+            duration = end_dt - start_dt
 
             # Extract additional valuable information
             description = event.get("description", "")
             location = event.get("location", "")
-            status = event.get("status", "confirmed")
+            # Intern values that repeat across events (e.g. instances of one recurring meeting) to share storage
+            status = sys.intern(event.get("status", "confirmed"))
 
             # Fix: Check multiple indicators for recurring events
-            is_recurring = (
-                "recurrence" in event
-                or "recurringEventId" in event
-                or (event.get("description", "") and "recurring series" in event.get("description", "").lower())
-            )
+            mentions_recurring_series = "recurring series" in description.lower()
+            is_recurring = "recurrence" in event or "recurringEventId" in event or mentions_recurring_series
 
             if is_recurring:
-                logger.debug(f"Recurring meeting detected: {event.get('summary')}")
+                logger.debug("Recurring meeting detected: %s", event.get("summary"))
                 if "recurrence" in event:
                     logger.debug("  - Has recurrence field")
                 if "recurringEventId" in event:
-                    logger.debug(f"  - Has recurringEventId field: {event.get('recurringEventId')}")
-                if event.get("description", "") and "recurring series" in event.get("description", "").lower():
+                    logger.debug("  - Has recurringEventId field: %s", event.get("recurringEventId"))
+                if mentions_recurring_series:
                     logger.debug("  - Description contains 'recurring series'")
 
-            organizer = event.get("organizer", {}).get("email", "")
+            organizer = sys.intern(event.get("organizer", {}).get("email", ""))
+            recurring_event_id = sys.intern(event.get("recurringEventId", ""))
 
             # Extract conference data if available
             conference_data = event.get("conferenceData", {})
@@ -341,30 +431,88 @@ class EventProcessor:
                         break
 
             # Create simplified event object with additional fields
-            processed_event = {
-                "summary": event["summary"],
-                "attendees": event["attendees"],
-                "start": datetime.datetime.strptime(start, DATE_FORMAT),
-                "end": datetime.datetime.strptime(end, DATE_FORMAT),
-                "duration": duration,
-                "iCalUID": event["iCalUID"],
-                "description": description,
-                "location": location,
-                "meeting_link": meeting_link,
-                "status": status,
-                "is_recurring": is_recurring,
-                "organizer": organizer,
-                "recurrence": event.get("recurrence", []),  # Store recurrence rules if available
-                "recurringEventId": event.get("recurringEventId", ""),  # Store recurring event ID if available
-            }
+            processed_event = ProcessedEvent(
+                summary=event["summary"],
+                attendees=event["attendees"],
+                start=start_dt,
+                end=end_dt,
+                duration=duration,
+                ical_uid=event["iCalUID"],
+                description=description,
+                location=location,
+                meeting_link=meeting_link,
+                status=status,
+                is_recurring=is_recurring,
+                mentions_recurring_series=mentions_recurring_series,
+                organizer=organizer,
+                recurrence=event.get("recurrence", []),  # Store recurrence rules if available
+                recurring_event_id=recurring_event_id,  # Store recurring event ID if available
+            )
 
             # Use UID as key to deduplicate
             processed_events[event["iCalUID"]] = processed_event
 
-        logger.debug(f"Processed {len(processed_events)} unique events")
+        logger.debug("Processed %d unique events", len(processed_events))
         return processed_events
 
 
+class AdaptiveConcurrencyLimiter:
+    """
+    Limit concurrent requests, adapting the limit to server overload.
+
+    The limit is halved whenever the server reports overload and grows by one
+    after a run of consecutive successes (additive increase, multiplicative decrease).
+    Use an instance as a context manager around each request.
+    """
+
+    def __init__(self, initial_limit, min_limit, max_limit, increase_after=10):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit (int): Number of concurrent requests allowed at start
+            min_limit (int): Lowest the limit may drop to
+            max_limit (int): Highest the limit may grow to
+            increase_after (int): Consecutive successes required to raise the limit by one
+        """
+        self.limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_after = increase_after
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = threading.Condition()
+
+    def __enter__(self):
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+        return False
+
+    def record_success(self):
+        """Record a successful request, raising the limit after enough in a row."""
+        with self._condition:
+            self._successes += 1
+            if self._successes >= self.increase_after:
+                self._successes = 0
+                if self.limit < self.max_limit:
+                    self.limit += 1
+                    self._condition.notify()
+
+    def record_overload(self):
+        """Record an overloaded (rate-limited) request, halving the limit."""
+        with self._condition:
+            self._successes = 0
+            self.limit = max(self.min_limit, self.limit // 2)
+
+
 class ClickUpService:
     """Service for interacting with ClickUp API."""
 
@@ -380,7 +528,14 @@ class ClickUpService:
         self.api_key = api_key
         self.team_id = team_id
         self.list_id = list_id
-        self.headers = {"Authorization": api_key}
+
+        # Reuse keep-alive connections to the ClickUp API; the pool is sized for concurrent task creation
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=CLICKUP_MAX_WORKERS))
+        self._session.headers.update({"Authorization": api_key, "Content-Type": "application/json"})
+
+        # Start conservatively and let the limiter find the rate ClickUp accepts
+        self._limiter = AdaptiveConcurrencyLimiter(initial_limit=4, min_limit=1, max_limit=CLICKUP_MAX_WORKERS)
 
     def get_users(self):
         """
@@ -392,11 +547,11 @@ class ClickUpService:
         url = "https://api.clickup.com/api/v2/team"
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._session.get(url)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
-            logger.exception(f"Error retrieving ClickUp users: {e}")
+            logger.exception("Error retrieving ClickUp users: %s", e)
             return {"teams": []}
 
     def correlate_emails_to_ids(self, emails, teams_data):
@@ -410,17 +565,20 @@ class ClickUpService:
         Returns:
             dict: Mapping of emails to ClickUp user IDs
         """
-        email_to_id_map = {}
+        result = dict.fromkeys(emails)
+        remaining = set(result)
 
-        # Build email to ID mapping from teams data
+        # Record IDs only for the requested emails, stopping once all of them have been found
         for team in teams_data.get("teams", []):
             for member in team.get("members", []):
-                user_email = member.get("user", {}).get("email", "")
-                user_id = member.get("user", {}).get("id", "")
-                email_to_id_map[user_email] = user_id
+                user = member.get("user", {})
+                user_email = user.get("email", "")
+                if user_email in remaining:
+                    result[user_email] = user.get("id", "")
+                    remaining.discard(user_email)
+                    if not remaining:
+                        return result
 
-        # Find user IDs for the given emails
-        result = {email: email_to_id_map.get(email, None) for email in emails}
         return result
 
     def create_task(self, event, assignee_ids):
@@ -428,7 +586,7 @@ class ClickUpService:
         Create a task in ClickUp from a calendar event.
 
         Args:
-            event (dict): Processed calendar event
+            event (ProcessedEvent): Processed calendar event
             assignee_ids (list): List of ClickUp user IDs to assign
 
         Returns:
@@ -436,58 +594,51 @@ class ClickUpService:
         """
         url = f"https://api.clickup.com/api/v2/list/{self.list_id}/task"
 
-        # Format attendees for description
+        # Format attendees for description and determine if all attendees are internal
         amc_attendees = []
         guest_attendees = []
+        all_attendees_internal = True
 
-        for attendee in event["attendees"]:
-            if any(domain in attendee["email"] for domain in HOST_DOMAINS):
+        for attendee in event.attendees:
+            if is_internal_email(attendee["email"]):
                 amc_attendees.append(attendee["email"].split("@")[0].capitalize())
             else:
                 guest_attendees.append(attendee["email"])
+                all_attendees_internal = False
 
         attendees_str = ", ".join(sorted(amc_attendees) + sorted(guest_attendees))
 
         # Create rich description with additional information
-        description = f"{event['summary']}\n\n"
+        description = f"{event.summary}\n\n"
 
         # Add meeting description/agenda if available, cleaned from HTML
-        if event["description"]:
-            cleaned_description = clean_html(event["description"])
+        if event.description:
+            cleaned_description = clean_html(event.description)
             description += f"Agenda:\n{cleaned_description}\n\n"
 
         # Add location and meeting link information
-        if event["location"]:
-            description += f"Location: {event['location']}\n"
+        if event.location:
+            description += f"Location: {event.location}\n"
 
-        if event["meeting_link"]:
-            description += f"Meeting Link: {event['meeting_link']}\n"
+        if event.meeting_link:
+            description += f"Meeting Link: {event.meeting_link}\n"
 
         # Add attendees list
         description += f"Attendees: {attendees_str}\n"
 
         # Add recurrence information if available
-        if event["is_recurring"]:
-            if event["recurrence"]:
+        if event.is_recurring:
+            if event.recurrence:
                 # Format recurrence rules for better readability
-                recurrence_rules = [rule.replace("RRULE:", "") for rule in event["recurrence"]]
+                recurrence_rules = [rule.replace("RRULE:", "") for rule in event.recurrence]
                 if recurrence_rules:
                     description += f"Recurrence: {', '.join(recurrence_rules)}\n"
-            elif event["recurringEventId"]:
-                description += f"Part of a recurring series (ID: {event['recurringEventId']})\n"
+            elif event.recurring_event_id:
+                description += f"Part of a recurring series (ID: {event.recurring_event_id})\n"
             else:
                 description += "Part of a recurring series\n"
 
         # Determine meeting type based on if all attendees are internal
-        internal_domains = HOST_DOMAINS
-        all_attendees_internal = True
-
-        for attendee in event["attendees"]:
-            attendee_email = attendee.get("email", "")
-            if not any(domain in attendee_email for domain in internal_domains):
-                all_attendees_internal = False
-                break
-
         meeting_type = "internal-meeting" if all_attendees_internal else "client-meeting"
 
         # Map meeting status to priority
@@ -496,13 +647,13 @@ class ClickUpService:
             "tentative": 2,  # Normal priority
             "cancelled": 1,  # Low priority
         }
-        meeting_priority = status_priority_map.get(event["status"], 3)
+        meeting_priority = status_priority_map.get(event.status, 3)
 
         # Build tags list
         tags = ["meeting"]
 
         # Add recurring tag if applicable
-        if event["is_recurring"]:
+        if event.is_recurring:
             tags.append("recurring-meeting")
 
         # Add meeting type tag
@@ -511,43 +662,81 @@ class ClickUpService:
         # Prepare request
         query = {"custom_task_ids": "true", "team_id": self.team_id}
 
+        start_ms = int(event.start.timestamp() * 1000)
+
         payload = {
-            "name": event["summary"],
+            "name": event.summary,
             "description": description,
-            "time_estimate": int(event["duration"].total_seconds() * 1000),
-            "start_date": int(calendar.timegm(event["start"].timetuple()) * 1000),
-            "due_date": int(calendar.timegm(event["start"].timetuple()) * 1000),
+            "time_estimate": int(event.duration.total_seconds() * 1000),
+            "start_date": start_ms,
+            "due_date": start_ms,
             "assignees": assignee_ids,
             "priority": meeting_priority,
             "tags": tags,
         }
 
-        headers = {"Content-Type": "application/json", "Authorization": self.api_key}
+        logger.debug("Creating task: %s with attendees: %s", event.summary, attendees_str)
+        logger.debug("Is recurring: %s, Tags: %s", event.is_recurring, tags)
+
+        # Log details about why this is or isn't detected as recurring; only needed for debug output or a warning
+        if logger.isEnabledFor(logging.DEBUG) or not event.is_recurring:
+            recurring_reasons = []
+            if event.recurrence:
+                recurring_reasons.append("Has 'recurrence' field")
+            if event.recurring_event_id:
+                recurring_reasons.append(f"Has 'recurringEventId': {event.recurring_event_id}")
+            if event.mentions_recurring_series:
+                recurring_reasons.append("Description contains 'recurring series'")
+
+            if event.is_recurring:
+                logger.debug("Recurring meeting reasons: %s", ", ".join(recurring_reasons))
+            elif recurring_reasons:
+                logger.warning(
+                    "Meeting has recurring indicators but wasn't classified as recurring: %s", recurring_reasons
+                )
 
-        logger.debug(f"Creating task: {event['summary']} with attendees: {attendees_str}")
-        logger.debug(f"Is recurring: {event['is_recurring']}, Tags: {tags}")
+        # Serialize once so that retries after rate limiting resend the same bytes
+        body = json.dumps(payload, allow_nan=False).encode("utf-8")
 
-        # Log details about why this is or isn't detected as recurring
-        recurring_reasons = []
-        if "recurrence" in event:
-            recurring_reasons.append("Has 'recurrence' field")
-        if event.get("recurringEventId", ""):
-            recurring_reasons.append(f"Has 'recurringEventId': {event['recurringEventId']}")
-        if event.get("description", "") and "recurring series" in event.get("description", "").lower():
-            recurring_reasons.append("Description contains 'recurring series'")
+        for attempt in range(CLICKUP_MAX_RETRIES + 1):
+            try:
+                with self._limiter:
+                    response = self._session.post(url, data=body, params=query)
+
+                if response.status_code == 429:
+                    self._limiter.record_overload()
+                    if attempt < CLICKUP_MAX_RETRIES:
+                        delay = self._get_retry_delay(response, attempt)
+                        logger.warning("ClickUp rate limit hit for '%s'. Retrying in %.1fs...", event.summary, delay)
+                        time.sleep(delay)
+                        continue
+
+                response.raise_for_status()
+                self._limiter.record_success()
+                return True
+            except requests.RequestException as e:
+                logger.exception("Error creating ClickUp task: %s", e)
+                return False
+
+    @staticmethod
+    def _get_retry_delay(response, attempt):
+        """
+        Work out how long to wait before retrying a rate-limited request.
 
-        if event["is_recurring"]:
-            logger.debug(f"Recurring meeting reasons: {', '.join(recurring_reasons)}")
-        elif recurring_reasons:
-            logger.warning(f"Meeting has recurring indicators but wasn't classified as recurring: {recurring_reasons}")
+        Args:
+            response (Response): The HTTP 429 response
+            attempt (int): Zero-based number of the attempt that was rate limited
 
+        Returns:
+            float: Delay in seconds
+        """
+        # ClickUp reports when the rate limit window resets as a Unix timestamp
+        reset = response.headers.get("X-RateLimit-Reset")
         try:
-            response = requests.post(url, json=payload, headers=headers, params=query)
-            response.raise_for_status()
-            return True
-        except requests.RequestException as e:
-            logger.exception(f"Error creating ClickUp task: {e}")
-            return False
+            delay = float(reset) - time.time()
+        except (TypeError, ValueError):
+            delay = 2**attempt
+        return min(max(delay, 1.0), CLICKUP_MAX_RETRY_DELAY)
 
 
 class CalendarSyncApp:
@@ -561,7 +750,7 @@ class CalendarSyncApp:
 
     def run(self):
         """Execute the sync process."""
-        logger.info(f"Starting Calendar to ClickUp sync (v{__version__})...")
+        logger.info("Starting Calendar to ClickUp sync (v%s)...", __version__)
 
         # 1. Fetch calendar events
         logger.info("Fetching calendar events...")
@@ -581,34 +770,40 @@ class CalendarSyncApp:
         success_count = 0
         recurring_count = 0
         recurring_types = {"recurrence_field": 0, "recurringEventId_field": 0, "description_text": 0}
+        task_requests = []
 
         for event_id, event in processed_events.items():
             # Get assignee IDs
             assignee_ids = []
-            for attendee in event["attendees"]:
+            for attendee in event.attendees:
                 if attendee["email"] in user_id_map and user_id_map[attendee["email"]]:
                     assignee_ids.append(user_id_map[attendee["email"]])
 
             # Count recurring events and track detection method
-            if event["is_recurring"]:
+            if event.is_recurring:
                 recurring_count += 1
-                if "recurrence" in event:
+                if event.recurrence:
                     recurring_types["recurrence_field"] += 1
-                if event.get("recurringEventId", ""):
+                if event.recurring_event_id:
                     recurring_types["recurringEventId_field"] += 1
-                if event.get("description", "") and "recurring series" in event.get("description", "").lower():
+                if event.mentions_recurring_series:
                     recurring_types["description_text"] += 1
 
-            # Create task
-            if self.clickup_service.create_task(event, assignee_ids):
-                success_count += 1
+            task_requests.append((event, assignee_ids))
+
+        # Create tasks concurrently; each one is an independent HTTP request
+        if task_requests:
+            max_workers = min(CLICKUP_MAX_WORKERS, len(task_requests))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(lambda request: self.clickup_service.create_task(*request), task_requests)
+                success_count = sum(1 for created in results if created)
 
-        logger.info(f"Sync completed. Created {success_count} of {len(processed_events)} tasks in ClickUp.")
-        logger.info(f"Recurring meetings detected: {recurring_count}")
-        logger.info(f"Recurring detection breakdown:")
-        logger.info(f"  - Via recurrence field: {recurring_types['recurrence_field']}")
-        logger.info(f"  - Via recurringEventId field: {recurring_types['recurringEventId_field']}")
-        logger.info(f"  - Via description text: {recurring_types['description_text']}")
+        logger.info("Sync completed. Created %d of %d tasks in ClickUp.", success_count, len(processed_events))
+        logger.info("Recurring meetings detected: %d", recurring_count)
+        logger.info("Recurring detection breakdown:")
+        logger.info("  - Via recurrence field: %d", recurring_types["recurrence_field"])
+        logger.info("  - Via recurringEventId field: %d", recurring_types["recurringEventId_field"])
+        logger.info("  - Via description text: %d", recurring_types["description_text"])
 
 
 def main():
@@ -617,7 +812,7 @@ def main():
         app = CalendarSyncApp()
         app.run()
     except Exception as e:
-        logger.critical(f"Application failed: {e}", exc_info=True)
+        logger.critical("Application failed: %s", e, exc_info=True)
         return 1
     return 0
 
@@ -8,7 +8,6 @@ SERVICE_ACCOUNT_FILE = "your-google-service-account-creds-file-here.json"
 
 # Calendar sync settings
 CALENDAR_SYNC_DAYS = 14  # Number of days to look ahead
-DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 DATE_FORMAT_NO_TIME = "%Y-%m-%d"
 
 # User accounts to sync